@@ -29,16 +29,31 @@ import json
 import math
 import time
 import random
+import bisect
+from array import array
 import webbrowser
+from urllib.parse import quote_plus
 import datetime
 import calendar
+import concurrent.futures
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 
 APP_TITLE = "HALTMANN WORKS CO — MariOS 64 (Tribute)"
 FRAME_MS = 16  # ~60 FPS
+DESKTOP_FRAME_MS = 33  # ~30 FPS is plenty for the desktop icon bob
 RNG_SEED = 1337  # determinism for any randomized decorations
 
+# Simple gradient/backdrop suggestions per theme (top, bottom); None is the fallback
+THEME_COLORS = {
+    "foyer": ("#2b2d42", "#8d99ae"),
+    "library": ("#3b2f2f", "#a67c52"),
+    "workshop": ("#1b262c", "#0f4c75"),
+    "throne": ("#3d1e6d", "#c44536"),
+    None: ("#202020", "#404040"),
+}
+
 # ----------------------------- Utility helpers -----------------------------
 
 def clamp(v, lo, hi):
@@ -47,10 +62,74 @@ def clamp(v, lo, hi):
 def now_str():
     return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+@functools.lru_cache(maxsize=32)
+def _month_text(year, month):
+    return calendar.TextCalendar(calendar.SUNDAY).formatmonth(theyear=year, themonth=month)
+
+def _put_rect(img, x1, y1, x2, y2, color):
+    """Fill a rectangle of a PhotoImage with a solid color, clipped to the image."""
+    W, H = img.width(), img.height()
+    x1, y1 = clamp(int(x1), 0, W), clamp(int(y1), 0, H)
+    x2, y2 = clamp(int(x2), 0, W), clamp(int(y2), 0, H)
+    if x2 > x1 and y2 > y1:
+        img.put(color, to=(x1, y1, x2, y2))
+
+def _put_ellipse(img, x1, y1, x2, y2, color):
+    """Fill an axis-aligned ellipse in a PhotoImage, one put() per scanline."""
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+    for yy in range(int(y1), int(y2)):
+        d = (yy + 0.5 - cy) / ry
+        half = rx * math.sqrt(max(0.0, 1 - d*d))
+        _put_rect(img, round(cx - half), yy, round(cx + half), yy + 1, color)
+
+def _rounded_rect_points(x, y, w, h, r):
+    """Control points for a rounded rectangle drawn with create_polygon(smooth=True).
+    Doubled points keep the edges straight; the spline only bends at the corners.
+    """
+    return [x+r, y, x+r, y, x+w-r, y, x+w-r, y, x+w, y,
+            x+w, y+r, x+w, y+r, x+w, y+h-r, x+w, y+h-r, x+w, y+h,
+            x+w-r, y+h, x+w-r, y+h, x+r, y+h, x+r, y+h, x, y+h,
+            x, y+h-r, x, y+h-r, x, y+r, x, y+r, x, y]
+
+def _gradient(top, bottom, steps=32):
+    """List of `steps` #rrggbb colors blending linearly from top to bottom."""
+    # parse the endpoints once; the loop is pure integer lerps
+    tr, tg, tb = bytes.fromhex(top[1:7])
+    br, bg, bb = bytes.fromhex(bottom[1:7])
+    n = steps - 1
+    colors = []
+    for i in range(steps):
+        r = tr + (br-tr)*i//n
+        g = tg + (bg-tg)*i//n
+        b = tb + (bb-tb)*i//n
+        colors.append(f"#{r:02x}{g:02x}{b:02x}")
+    return colors
+
+# Background gradient palettes, computed once per theme
+_GRADIENT_CACHE = {theme: _gradient(top, bottom) for theme, (top, bottom) in THEME_COLORS.items()}
+
+def _gear_outline(teeth=8, r_in=15, r_out=23):
+    """Flat [dx0, dy0, dx1, dy1, ...] offsets tracing a gear, four points per tooth."""
+    pts = []
+    step = math.tau / teeth
+    for i in range(teeth):
+        a = i * step
+        for r, da in ((r_in, -0.36), (r_out, -0.2), (r_out, 0.2), (r_in, 0.36)):
+            pts += [round(math.cos(a+da)*r, 1), round(math.sin(a+da)*r, 1)]
+    return pts
+
+# Settings glyph template, translated to the icon center at draw time
+_GEAR_POLY = _gear_outline()
+
 # ----------------------------- Icon/Room Model -----------------------------
 
 class Icon:
     """A canvas-based icon made from shapes+text, representing either an app or a decoration."""
+    # persisted fields, in layout-file order
+    _FIELDS = ("tag", "title", "kind", "app_id", "x", "y", "w", "h", "fill", "fg", "unremovable", "animate")
+    __slots__ = _FIELDS + ("items", "vphase", "_last_bob_dy", "dirty", "geom_key", "drawn_xy", "drawn_fill")
+
     def __init__(self, tag, title, kind, app_id=None, x=100, y=100, w=96, h=72,
                  fill="#2c3e50", fg="#ecf0f1", unremovable=False, animate=False):
         self.tag = tag            # per-icon tag e.g., "icon_5"
@@ -63,14 +142,15 @@ class Icon:
         self.unremovable = unremovable
         self.animate = animate
         self.items = []           # canvas item ids
-        self.vphase = random.random() * math.tau  # for bob animation
+        self.vphase = None        # bob animation phase, seeded on first animated frame
+        self._last_bob_dy = 0     # bob offset currently applied to the canvas items
+        self.dirty = False        # items must be recreated on the next render
+        self.geom_key = None      # (w, h, app_id) the current items were built for
+        self.drawn_xy = None      # (x, y) the current items sit at, excluding bob
+        self.drawn_fill = None    # body fill the current items were given
 
     def to_dict(self):
-        return {
-            "tag": self.tag, "title": self.title, "kind": self.kind,
-            "app_id": self.app_id, "x": self.x, "y": self.y, "w": self.w, "h": self.h,
-            "fill": self.fill, "fg": self.fg, "unremovable": self.unremovable, "animate": self.animate
-        }
+        return {k: getattr(self, k) for k in Icon._FIELDS}
 
     @staticmethod
     def from_dict(d):
@@ -84,13 +164,18 @@ class Icon:
 
 class Room:
     """A room in the desktop, with background rendering + a set of icons."""
+    _FIELDS = ("name", "theme")
+    __slots__ = _FIELDS + ("icons",)
+
     def __init__(self, name, theme="foyer"):
         self.name = name
         self.theme = theme
         self.icons = []  # list[Icon]
 
     def to_dict(self):
-        return {"name": self.name, "theme": self.theme, "icons": [ic.to_dict() for ic in self.icons]}
+        d = {k: getattr(self, k) for k in Room._FIELDS}
+        d["icons"] = [ic.to_dict() for ic in self.icons]
+        return d
 
     @staticmethod
     def from_dict(d):
@@ -98,6 +183,75 @@ class Room:
         r.icons = [Icon.from_dict(ic) for ic in d.get("icons", [])]
         return r
 
+# ----------------------------- Seed Layout -----------------------------
+
+_DEFAULT_ROOMS = [("Foyer", "foyer"), ("Library", "library"), ("Workshop", "workshop"), ("Throne", "throne")]
+
+# (title, app_id, x, y, fill, fg) for the special app icons placed in the Foyer
+_FOYER_APPS = [
+    ("Mario Demo", "mario", 120, 120, "#e74c3c", "#ecf0f1"),
+    ("HALT‑DOS", "terminal", 260, 120, "#2ecc71", "#ecf0f1"),
+    ("TextPad", "textpad", 400, 120, "#3498db", "#ecf0f1"),
+    ("Web", "web", 540, 120, "#9b59b6", "#ecf0f1"),
+    ("Calendar", "calendar", 680, 120, "#f1c40f", "#000000"),
+    ("Settings", "settings", 820, 120, "#e67e22", "#ecf0f1"),
+    ("Assistant", "assistant", 960, 120, "#95a5a6", "#ecf0f1"),
+]
+_FOYER_DECOR_XS = [160 + i*160 for i in range(5)]
+
+# (room, app icon spec) for the other default rooms
+_ROOM_BASICS = [
+    ("Library", ("TextPad", "textpad", 140, 150, "#3498db", "#ecf0f1")),
+    ("Workshop", ("Settings", "settings", 140, 150, "#e67e22", "#ecf0f1")),
+    ("Throne", ("HALT‑DOS", "terminal", 140, 150, "#2ecc71", "#ecf0f1")),
+]
+
+# ----------------------------- Background I/O -----------------------------
+
+# Disk reads/writes run here so a large file never blocks the Tk event loop;
+# results are handed back to the Tk thread by _when_done.
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+def _when_done(widget, fut, callback, poll_ms=20):
+    """Call callback(fut) on the Tk thread once fut finishes (dropped if widget is gone)."""
+    # poll from the root: after() callbacks registered on widget die with it
+    root = widget._root()
+    def poll():
+        if not widget.winfo_exists():
+            return
+        if fut.done():
+            callback(fut)
+        else:
+            root.after(poll_ms, poll)
+    root.after(poll_ms, poll)
+
+def _read_text(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def _write_text(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def _write_layout(path, data):
+    # encode in one shot and write once; json.dump streams many tiny writes
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+def _read_layout(path):
+    with open(path, "rb") as f:
+        room_dicts = json.loads(f.read()).get("rooms", [])
+    # release each room dict as soon as its Room is built, so the parsed
+    # document and the model are never both fully alive
+    rooms = []
+    room_dicts.reverse()
+    while room_dicts:
+        rooms.append(Room.from_dict(room_dicts.pop()))
+    if not rooms:
+        raise ValueError("No rooms found in file")
+    return rooms
+
 # ----------------------------- Desktop Application -----------------------------
 
 class HaltmannDesktop(tk.Tk):
@@ -112,12 +266,15 @@ class HaltmannDesktop(tk.Tk):
 
         # State
         self.rooms = {}
+        self._sorted_room_names = []  # kept in sync by _add_room/_del_room
         self.current_room = None
         self.edit_mode = tk.BooleanVar(value=False)
         self.status_var = tk.StringVar(value="Ready")
         self.assistant_name = tk.StringVar(value="Toad (Assistant)")
         self.assistant_persona = ["Hi! Click an icon to open an app.", "Tip: Right‑click icons for options.",
                                   "Type 'help' in HALT‑DOS for commands."]
+        self._chat_buffer = []
+        self._chat_flush_pending = False
 
         # Drag state
         self.dragging = False
@@ -125,13 +282,31 @@ class HaltmannDesktop(tk.Tk):
         self.drag_offx = 0
         self.drag_offy = 0
 
+        # Cached room backdrops, keyed by (theme, W, H)
+        self._bg_cache = {}
+        self._canvas_size = (0, 0)
+        self._pillar_img = None
+        self._pillar_h = None
+        self._bg_item = None
+        self._banner_item = None
+        self._drawn_icons = {}  # id(Icon) -> Icon whose items are currently on the canvas
+        self._render_pending = False
+        self._room_views_pending = False
+        self._rooms_menu_dirty = False
+
+        # Icon "bob" loop; only scheduled while the current room has animated icons
+        self._anim_scheduled = False
+        self._anim_icons = []  # animated icons of the current room; the only ones _tick visits
+        self._anim_t = 0.0
+
         self._build_menu()
         self._build_ui()
         self._seed_rooms()
         self._show_splash_then_start()
 
-        # Animation loop for icon "bob" and ambient effects
-        self.after(FRAME_MS, self._tick)
+        # Day-of-month shown on calendar icons; refreshed once a minute off the draw path
+        self._today_day = datetime.date.today().day
+        self.after(60_000, self._refresh_today)
 
     # ----------------------------- UI Construction -----------------------------
 
@@ -202,6 +377,11 @@ class HaltmannDesktop(tk.Tk):
         self.canvas.bind("<ButtonRelease-1>", self._on_canvas_release)
         self.canvas.bind("<Double-Button-1>", self._on_canvas_double)
         self.canvas.bind("<Button-3>", self._on_canvas_right)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # Pool of hidden sparkle dots that _sparkle recycles instead of creating/deleting items
+        self._spark_pool = [self.canvas.create_oval(-9, -9, -5, -5, fill="#ffffff", outline="",
+                                                    state="hidden", tags="spark") for _ in range(64)]
+        self._spark_next = 0
 
         # Right: assistant chat
         right = ttk.Frame(self, padding=8)
@@ -256,7 +436,7 @@ class HaltmannDesktop(tk.Tk):
         def close_splash(*_):
             splash.destroy()
             self.deiconify()
-            self._render_room()
+            self._request_render()
 
         splash.bind("<Key>", close_splash)
         splash.bind("<Button-1>", close_splash)
@@ -268,8 +448,8 @@ class HaltmannDesktop(tk.Tk):
 
     def _seed_rooms(self):
         # Create default rooms with some special app icons
-        for rn, theme in [("Foyer", "foyer"), ("Library", "library"), ("Workshop", "workshop"), ("Throne", "throne")]:
-            self.rooms[rn] = Room(rn, theme)
+        for rn, theme in _DEFAULT_ROOMS:
+            self._add_room(Room(rn, theme))
 
         self.current_room = "Foyer"
         self._rebuild_rooms_menu()
@@ -277,25 +457,15 @@ class HaltmannDesktop(tk.Tk):
 
         # Place special app icons in foyer
         r = self.rooms["Foyer"]
-        r.icons.extend([
-            self._mk_app_icon("Mario Demo", "mario", 120, 120, fill="#e74c3c"),
-            self._mk_app_icon("HALT‑DOS", "terminal", 260, 120, fill="#2ecc71"),
-            self._mk_app_icon("TextPad", "textpad", 400, 120, fill="#3498db"),
-            self._mk_app_icon("Web", "web", 540, 120, fill="#9b59b6"),
-            self._mk_app_icon("Calendar", "calendar", 680, 120, fill="#f1c40f", fg="#000000"),
-            self._mk_app_icon("Settings", "settings", 820, 120, fill="#e67e22"),
-            self._mk_app_icon("Assistant", "assistant", 960, 120, fill="#95a5a6"),
-        ])
+        r.icons.extend(self._mk_app_icon(*spec) for spec in _FOYER_APPS)
 
         # Some decorations (removable)
-        for i in range(5):
-            x = 160 + i*160
-            r.icons.append(self._mk_decor_icon(f"Coin {i+1}", x, 320, w=40, h=40, fill="#f39c12", animate=True))
+        r.icons.extend(self._mk_decor_icon(f"Coin {i+1}", x, 320, w=40, h=40, fill="#f39c12", animate=True)
+                       for i, x in enumerate(_FOYER_DECOR_XS))
 
         # Other rooms get a few basics
-        self.rooms["Library"].icons.append(self._mk_app_icon("TextPad", "textpad", 140, 150, fill="#3498db"))
-        self.rooms["Workshop"].icons.append(self._mk_app_icon("Settings", "settings", 140, 150, fill="#e67e22"))
-        self.rooms["Throne"].icons.append(self._mk_app_icon("HALT‑DOS", "terminal", 140, 150, fill="#2ecc71"))
+        for rn, spec in _ROOM_BASICS:
+            self.rooms[rn].icons.append(self._mk_app_icon(*spec))
 
     def _mk_app_icon(self, title, app_id, x, y, fill="#2c3e50", fg="#ecf0f1"):
         self.icon_counter += 1
@@ -309,86 +479,178 @@ class HaltmannDesktop(tk.Tk):
         return Icon(tag, title, "decor", app_id=None, x=x, y=y, w=w, h=h,
                     fill=fill, fg=fg, unremovable=False, animate=animate)
 
+    def _add_room(self, room):
+        if room.name not in self.rooms:
+            bisect.insort(self._sorted_room_names, room.name)
+        self.rooms[room.name] = room
+
+    def _del_room(self, rn):
+        del self.rooms[rn]
+        self._sorted_room_names.remove(rn)
+
+    def _request_room_views(self, menu=True):
+        # coalesce room menu/list rebuilds like _request_render; menu=False only
+        # needs the list selection refreshed
+        self._rooms_menu_dirty |= menu
+        if not self._room_views_pending:
+            self._room_views_pending = True
+            self.after_idle(self._do_room_views)
+
+    def _do_room_views(self):
+        self._room_views_pending = False
+        if self._rooms_menu_dirty:
+            self._rooms_menu_dirty = False
+            self._rebuild_rooms_menu()
+        self._refresh_room_list()
+
     def _rebuild_rooms_menu(self):
         self.rooms_menu.delete(0, "end")
-        for rn in sorted(self.rooms.keys()):
+        for rn in self._sorted_room_names:
             self.rooms_menu.add_command(label=rn, command=lambda rnn=rn: self._switch_room(rnn))
 
     def _refresh_room_list(self):
         self.room_list.delete(0, "end")
-        for rn in sorted(self.rooms.keys()):
+        for rn in self._sorted_room_names:
             self.room_list.insert("end", rn)
         try:
-            idx = list(sorted(self.rooms.keys())).index(self.current_room)
+            idx = self._sorted_room_names.index(self.current_room)
             self.room_list.select_set(idx)
         except Exception:
             pass
 
     # ----------------------------- Canvas Rendering -----------------------------
 
+    def _request_render(self):
+        # coalesce bursts of edits/resizes into one render per idle cycle
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._do_render)
+
+    def _do_render(self):
+        self._render_pending = False
+        if self.current_room in self.rooms:
+            self._render_room()
+
     def _render_room(self):
-        self.canvas.delete("all")
         rm = self.rooms[self.current_room]
         self.theme_var.set(f"Room: {rm.name} / Theme: {rm.theme}")
         self._draw_room_background(rm.theme)
 
+        # Diff against what is already on the canvas: icons that are still shown keep
+        # their items (moved/recolored in place), stale ones or ones whose shape changed
+        # are deleted, and only new ones are created.
+        # Keyed by identity, not tag: duplicated rooms reuse icon tags, and two icons in
+        # one room can end up sharing a tag, so stale items are deleted by item id too.
+        drawn = self._drawn_icons
+        live = {id(ic) for ic in rm.icons}
+        for key, ic in list(drawn.items()):
+            if key not in live or ic.dirty or ic.geom_key != (ic.w, ic.h, ic.app_id):
+                if ic.items:
+                    self.canvas.delete(*ic.items)
+                ic.items = []
+                del drawn[key]
+        fresh = []
         for ic in rm.icons:
-            self._draw_icon(ic)
+            if id(ic) in drawn:
+                self._update_icon_position(ic)
+                if ic.drawn_fill != ic.fill:
+                    self.canvas.itemconfig(ic.items[0], fill=ic.fill)
+                    ic.drawn_fill = ic.fill
+                fresh.append(False)
+            else:
+                self._draw_icon(ic)
+                drawn[id(ic)] = ic
+                fresh.append(True)
+        # New items land on top of the stack; slide each one under the icon after it
+        # so stacking keeps following list order (which _icon_under_cursor relies on).
+        above = None      # first item of the next icon in the list
+        kept_above = False  # whether any later icon kept its old items
+        for ic, is_new in zip(reversed(rm.icons), reversed(fresh)):
+            if is_new and kept_above:
+                for iid in ic.items:
+                    self.canvas.tag_lower(iid, above)
+            kept_above = kept_above or not is_new
+            above = ic.items[0]
 
         self._refresh_status()
+        self._anim_icons = [ic for ic in rm.icons if ic.animate]
+        self._ensure_anim_running()
 
     def _draw_room_background(self, theme):
         W = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
         H = self.canvas.winfo_height() or self.canvas.winfo_reqheight()
-        # Simple gradient/backdrop suggestions per theme
-        if theme == "foyer":
-            top, bottom = "#2b2d42", "#8d99ae"
-        elif theme == "library":
-            top, bottom = "#3b2f2f", "#a67c52"
-        elif theme == "workshop":
-            top, bottom = "#1b262c", "#0f4c75"
-        elif theme == "throne":
-            top, bottom = "#3d1e6d", "#c44536"
+        # one cached raster per (theme, size) instead of ~50 canvas items per render
+        key = (theme, W, H)
+        img = self._bg_cache.get(key)
+        if img is None:
+            img = self._bg_cache[key] = self._build_room_background(theme, W, H)
+        title = f"Princess Peach's Castle — {self.current_room}"
+        # the backdrop and banner items live for the whole session; just re-point them
+        if self._bg_item is None:
+            self._bg_item = self.canvas.create_image(0, 0, anchor="nw", image=img, tags="bg")
+            self._banner_item = self.canvas.create_text(W//2, 18, text=title, fill="#ffffff",
+                                                        font=("Segoe UI", 12, "bold"), tags="bg")
+            self.canvas.tag_lower("bg")
         else:
-            top, bottom = "#202020", "#404040"
-
-        # vertical gradient by rectangles
-        steps = 32
-        for i in range(steps):
-            t = i / (steps-1)
-            r = int((1-t)*int(top[1:3],16) + t*int(bottom[1:3],16))
-            g = int((1-t)*int(top[3:5],16) + t*int(bottom[3:5],16))
-            b = int((1-t)*int(top[5:7],16) + t*int(bottom[5:7],16))
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            self.canvas.create_rectangle(0, int(H*(i/steps)), W, int(H*((i+1)/steps))+2, fill=color, outline=color)
+            self.canvas.itemconfig(self._bg_item, image=img)
+            self.canvas.itemconfig(self._banner_item, text=title)
+            self.canvas.coords(self._banner_item, W//2, 18)
 
-        # simple castle floor
-        self.canvas.create_rectangle(0, H-80, W, H, fill="#3b3b3b", outline="")
+    def _build_room_background(self, theme, W, H):
+        colors = _GRADIENT_CACHE.get(theme) or _GRADIENT_CACHE[None]
+        img = tk.PhotoImage(width=W, height=H)
 
-        # pillars
-        for px in range(80, W, 220):
-            self.canvas.create_rectangle(px-20, 100, px+20, H-80, fill="#dfe6e9", outline="#636e72")
-            self.canvas.create_oval(px-25, 70, px+25, 120, fill="#dfe6e9", outline="#636e72")
+        # vertical gradient: one put() per band
+        steps = len(colors)
+        for i, color in enumerate(colors):
+            _put_rect(img, 0, int(H*(i/steps)), W, int(H*((i+1)/steps))+2, color)
 
-        # title banner
-        self.canvas.create_rectangle(0, 0, W, 36, fill="#000000", outline="")
-        self.canvas.create_text(W//2, 18, text=f"Princess Peach's Castle — {self.current_room}",
-                                fill="#ffffff", font=("Segoe UI", 12, "bold"))
+        # simple castle floor
+        _put_rect(img, 0, H-80, W, H, "#3b3b3b")
+
+        # pillars: stamp one cached sprite instead of rasterizing each pillar
+        sprite = self._pillar_sprite(H)
+        if sprite is not None:
+            for px in range(80, W, 220):
+                img.tk.call(img, "copy", sprite, "-to", px-25, 70)
+
+        # title banner strip
+        _put_rect(img, 0, 0, W, 36, "#000000")
+        return img
+
+    def _pillar_sprite(self, H):
+        # pillar shaft + capital spanning y=70..H-80, rebuilt only when the height changes
+        if self._pillar_h != H:
+            self._pillar_h = H
+            self._pillar_img = None
+            if H - 150 > 50:
+                sprite = tk.PhotoImage(width=50, height=H-150)
+                _put_rect(sprite, 5, 30, 45, H-150, "#636e72")
+                _put_rect(sprite, 6, 31, 44, H-151, "#dfe6e9")
+                _put_ellipse(sprite, 0, 0, 50, 50, "#636e72")
+                _put_ellipse(sprite, 1, 1, 49, 49, "#dfe6e9")
+                self._pillar_img = sprite
+        return self._pillar_img
+
+    def _on_canvas_configure(self, event):
+        size = (event.width, event.height)
+        if size == self._canvas_size:
+            return
+        self._canvas_size = size
+        # cached backdrops are sized to the canvas; drop them and redraw at the new size
+        self._bg_cache.clear()
+        self._request_render()
 
     def _draw_icon(self, ic: Icon):
         # Draw rounded rectangle + title
         x, y, w, h = ic.x, ic.y, ic.w, ic.h
         tag = ic.tag
         base = "icon"
-        # Rounded rectangle via 4 arcs + rects
+        # Rounded rectangle as a single smoothed polygon
         r = 12
         items = []
-        items.append(self.canvas.create_rectangle(x+r, y, x+w-r, y+h, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
-        items.append(self.canvas.create_rectangle(x, y+r, x+w, y+h-r, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
-        items.append(self.canvas.create_oval(x, y, x+2*r, y+2*r, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
-        items.append(self.canvas.create_oval(x+w-2*r, y, x+w, y+2*r, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
-        items.append(self.canvas.create_oval(x, y+h-2*r, x+2*r, y+h, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
-        items.append(self.canvas.create_oval(x+w-2*r, y+h-2*r, x+w, y+h, fill=ic.fill, outline="#000000", width=2, tags=(base, tag)))
+        items.append(self.canvas.create_polygon(_rounded_rect_points(x, y, w, h, r), fill=ic.fill, outline="#000000",
+                                                width=2, smooth=True, splinesteps=12, tags=(base, tag)))
 
         # Inner glyph: draw a minimalist icon based on app_id or decor
         self._draw_icon_glyph(ic, items)
@@ -397,6 +659,18 @@ class HaltmannDesktop(tk.Tk):
         items.append(self.canvas.create_text(x+w//2, y+h-12, text=ic.title, fill=ic.fg,
                                              font=("Segoe UI", 9, "bold"), tags=(base, tag)))
         ic.items = items
+        ic._last_bob_dy = 0
+        ic.dirty = False
+        ic.geom_key = (w, h, ic.app_id)
+        ic.drawn_xy = (x, y)
+        ic.drawn_fill = ic.fill
+
+    def _update_icon_position(self, ic: Icon):
+        # shift existing items to (ic.x, ic.y) without recreating them
+        dx, dy = ic.x - ic.drawn_xy[0], ic.y - ic.drawn_xy[1]
+        if dx or dy:
+            self.canvas.move(ic.tag, dx, dy)
+            ic.drawn_xy = (ic.x, ic.y)
 
     def _draw_icon_glyph(self, ic: Icon, items_accum):
         # draw a simple glyph in the icon area
@@ -425,21 +699,19 @@ class HaltmannDesktop(tk.Tk):
                 add(self.canvas.create_line(cx-18, cy-12 + i*8, cx+18, cy-12 + i*8, fill="#2c3e50", tags=(base, tag)))
         elif aid == "web":
             add(self.canvas.create_oval(cx-24, cy-24, cx+24, cy+24, outline="#ffffff", width=2, tags=(base, tag)))
-            add(self.canvas.create_line(cx-24, cy, cx+24, cy, fill="#ffffff", width=2, tags=(base, tag)))
-            add(self.canvas.create_line(cx, cy-24, cx, cy+24, fill="#ffffff", width=2, tags=(base, tag)))
+            # both crosshair strokes as one polyline
+            add(self.canvas.create_line(cx-24, cy, cx+24, cy, cx, cy, cx, cy-24, cx, cy+24,
+                                        fill="#ffffff", width=2, tags=(base, tag)))
             add(self.canvas.create_arc(cx-24, cy-24, cx+24, cy+24, start=30, extent=120, style="arc", outline="#ffffff", width=2, tags=(base, tag)))
             add(self.canvas.create_arc(cx-24, cy-24, cx+24, cy+24, start=210, extent=120, style="arc", outline="#ffffff", width=2, tags=(base, tag)))
         elif aid == "calendar":
             add(self.canvas.create_rectangle(cx-24, cy-18, cx+24, cy+20, fill="#ecf0f1", outline="#c0392b", width=3, tags=(base, tag)))
             add(self.canvas.create_rectangle(cx-24, cy-18, cx+24, cy-6, fill="#c0392b", outline="", tags=(base, tag)))
-            add(self.canvas.create_text(cx, cy+6, text=str(datetime.datetime.now().day), fill="#2c3e50", font=("Segoe UI", 16, "bold"), tags=(base, tag)))
+            add(self.canvas.create_text(cx, cy+6, text=str(self._today_day), fill="#2c3e50", font=("Segoe UI", 16, "bold"), tags=(base, tag)))
         elif aid == "settings":
-            # gear
-            for i in range(8):
-                ang = i * (math.tau/8)
-                ax = cx + math.cos(ang) * 20
-                ay = cy + math.sin(ang) * 20
-                add(self.canvas.create_rectangle(ax-4, ay-12, ax+4, ay-4, fill="#2c3e50", outline="", tags=(base, tag)))
+            # gear: one polygon for all teeth, plus the hub
+            pts = [v + (cx if k % 2 == 0 else cy) for k, v in enumerate(_GEAR_POLY)]
+            add(self.canvas.create_polygon(pts, fill="#2c3e50", outline="", tags=(base, tag)))
             add(self.canvas.create_oval(cx-14, cy-14, cx+14, cy+14, fill="#95a5a6", outline="#2c3e50", tags=(base, tag)))
         elif aid == "assistant":
             add(self.canvas.create_oval(cx-22, cy-18, cx+22, cy+18, fill="#1abc9c", outline="", tags=(base, tag)))
@@ -452,16 +724,12 @@ class HaltmannDesktop(tk.Tk):
     # ----------------------------- Interaction -----------------------------
 
     def _icon_under_cursor(self, event):
+        # hit-test the model directly; icons later in the list are drawn on top
         x, y = event.x, event.y
-        items = self.canvas.find_overlapping(x, y, x, y)
-        # return most recent with "icon" tag
-        for it in reversed(items):
-            tags = self.canvas.gettags(it)
-            if "icon" in tags:
-                # second tag is per-icon
-                for tg in tags:
-                    if tg.startswith("icon_"):
-                        return tg
+        for ic in reversed(self.rooms[self.current_room].icons):
+            top = ic.y + ic._last_bob_dy
+            if ic.x <= x <= ic.x + ic.w and top <= y <= top + ic.h:
+                return ic.tag
         return None
 
     def _get_icon_by_tag(self, tag):
@@ -483,9 +751,11 @@ class HaltmannDesktop(tk.Tk):
                 self.drag_offx = event.x - ic.x
                 self.drag_offy = event.y - ic.y
             else:
-                # selection feedback
-                self.canvas.scale(tag, ic.x + ic.w/2, ic.y + ic.h/2, 1.05, 1.05)
-                self.after(90, lambda: self.canvas.scale(tag, ic.x + ic.w/2, ic.y + ic.h/2, 1/1.05, 1/1.05))
+                # selection feedback: pulse the body outline; geometry stays in sync with ic.x/y/w/h
+                if ic.items:
+                    body = ic.items[0]
+                    self.canvas.itemconfig(body, width=3)
+                    self.after(90, lambda: self.canvas.itemconfig(body, width=2))
         else:
             # empty space click: maybe drop a decor in edit mode
             if self.edit_mode.get():
@@ -495,11 +765,10 @@ class HaltmannDesktop(tk.Tk):
         if self.dragging and self.drag_tag:
             ic = self._get_icon_by_tag(self.drag_tag)
             if ic:
-                nx = event.x - self.drag_offx
-                ny = event.y - self.drag_offy
-                ic.x = nx
-                ic.y = ny
-                self._render_room()
+                # translate only this icon's items; no full-canvas rebuild
+                ic.x = event.x - self.drag_offx
+                ic.y = event.y - self.drag_offy
+                self._update_icon_position(ic)
 
     def _on_canvas_release(self, event):
         if self.dragging:
@@ -559,7 +828,7 @@ class HaltmannDesktop(tk.Tk):
         )
         self.icon_counter += 1
         self.rooms[self.current_room].icons.append(new_ic)
-        self._render_room()
+        self._request_render()
 
     def _remove_icon(self, tag):
         ic = self._get_icon_by_tag(tag)
@@ -567,7 +836,7 @@ class HaltmannDesktop(tk.Tk):
             return
         rm = self.rooms[self.current_room]
         rm.icons = [k for k in rm.icons if k.tag != tag]
-        self._render_room()
+        self._request_render()
 
     def _resize_icon_dialog(self, tag):
         ic = self._get_icon_by_tag(tag)
@@ -578,12 +847,21 @@ class HaltmannDesktop(tk.Tk):
         h = simpledialog.askinteger("Resize", "Height (px):", initialvalue=ic.h, minvalue=40, maxvalue=240, parent=self)
         if h is None: return
         ic.w, ic.h = int(w), int(h)
-        self._render_room()
+        self._request_render()
 
     def _toggle_icon_anim(self, tag):
         ic = self._get_icon_by_tag(tag)
         if not ic: return
         ic.animate = not ic.animate
+        if not ic.animate and ic._last_bob_dy:
+            # settle back onto the resting position
+            self.canvas.move(ic.tag, 0, -ic._last_bob_dy)
+            ic._last_bob_dy = 0
+        if ic.animate:
+            self._anim_icons.append(ic)
+        elif ic in self._anim_icons:
+            self._anim_icons.remove(ic)
+        self._ensure_anim_running()
 
     def _add_random_decor(self, x, y):
         colors = ["#f39c12", "#1abc9c", "#e67e22", "#9b59b6", "#2ecc71", "#3498db", "#e74c3c"]
@@ -591,15 +869,26 @@ class HaltmannDesktop(tk.Tk):
         ic = self._mk_decor_icon(title, x, y, w=random.randint(48, 88), h=random.randint(40, 72),
                                  fill=random.choice(colors), animate=random.choice([True, False]))
         self.rooms[self.current_room].icons.append(ic)
-        self._render_room()
+        self._request_render()
 
     # ----------------------------- Assistant -----------------------------
 
     def _assistant_log(self, who, text):
+        # buffer lines arriving in the same idle tick; _flush_chat writes them in one go
+        self._chat_buffer.append(f"{now_str()}  {who}: {text}\n")
+        if not self._chat_flush_pending:
+            self._chat_flush_pending = True
+            self.after_idle(self._flush_chat)
+
+    def _flush_chat(self):
+        self._chat_flush_pending = False
+        if not self._chat_buffer:
+            return
         self.assistant_log.configure(state="normal")
-        self.assistant_log.insert("end", f"{now_str()}  {who}: {text}\n")
+        self.assistant_log.insert("end", "".join(self._chat_buffer))
         self.assistant_log.configure(state="disabled")
         self.assistant_log.see("end")
+        self._chat_buffer.clear()
 
     def _assistant_say(self, text):
         self._assistant_log(self.assistant_name.get(), text)
@@ -634,13 +923,13 @@ class HaltmannDesktop(tk.Tk):
         if rn not in self.rooms:
             return
         self.current_room = rn
-        self._refresh_room_list()
-        self._render_room()
+        self._request_room_views(menu=False)
+        self._request_render()
 
     def _on_room_select(self, _e):
         try:
             idx = self.room_list.curselection()[0]
-            rn = list(sorted(self.rooms.keys()))[idx]
+            rn = self._sorted_room_names[idx]
             self._switch_room(rn)
         except Exception:
             pass
@@ -652,9 +941,8 @@ class HaltmannDesktop(tk.Tk):
             messagebox.showerror("Exists", "A room with that name already exists.")
             return
         theme = random.choice(["foyer", "library", "workshop", "throne"])
-        self.rooms[rn] = Room(rn, theme)
-        self._rebuild_rooms_menu()
-        self._refresh_room_list()
+        self._add_room(Room(rn, theme))
+        self._request_room_views()
         self._switch_room(rn)
 
     def _duplicate_current_room(self):
@@ -667,9 +955,8 @@ class HaltmannDesktop(tk.Tk):
         src = self.rooms[rn]
         clone = Room(nrn, src.theme)
         clone.icons = [Icon.from_dict(ic.to_dict()) for ic in src.icons]
-        self.rooms[nrn] = clone
-        self._rebuild_rooms_menu()
-        self._refresh_room_list()
+        self._add_room(clone)
+        self._request_room_views()
 
     def _delete_current_room(self):
         if len(self.rooms) <= 1:
@@ -677,11 +964,10 @@ class HaltmannDesktop(tk.Tk):
             return
         rn = self.current_room
         if messagebox.askyesno("Delete Room", f"Delete room '{rn}'?"):
-            del self.rooms[rn]
-            self.current_room = sorted(self.rooms.keys())[0]
-            self._rebuild_rooms_menu()
-            self._refresh_room_list()
-            self._render_room()
+            self._del_room(rn)
+            self.current_room = self._sorted_room_names[0]
+            self._request_room_views()
+            self._request_render()
 
     # ----------------------------- Persistence -----------------------------
 
@@ -689,14 +975,22 @@ class HaltmannDesktop(tk.Tk):
         data = {
             "app_title": APP_TITLE,
             "time": now_str(),
-            "rooms": [self.rooms[r].to_dict() for r in sorted(self.rooms.keys())]
+            "rooms": [self.rooms[r].to_dict() for r in self._sorted_room_names]
         }
         path = filedialog.asksaveasfilename(title="Save Layout", defaultextension=".json",
                                             filetypes=[("JSON Files", "*.json")], initialfile="haltmann_layout.json")
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        self.status_var.set(f"Saving layout to {path}…")
+        _when_done(self, _IO_POOL.submit(_write_layout, path, data), lambda fut: self._layout_saved(path, fut))
+
+    def _layout_saved(self, path, fut):
+        try:
+            fut.result()
+        except Exception as e:
+            self.status_var.set("Ready")
+            messagebox.showerror("Save Error", f"Failed to save: {e}")
+            return
         self.status_var.set(f"Saved layout to {path}")
 
     def load_layout(self):
@@ -704,51 +998,96 @@ class HaltmannDesktop(tk.Tk):
                                           filetypes=[("JSON Files", "*.json")])
         if not path:
             return
+        self.status_var.set(f"Loading layout from {path}…")
+        _when_done(self, _IO_POOL.submit(_read_layout, path), lambda fut: self._layout_loaded(path, fut))
+
+    def _layout_loaded(self, path, fut):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            rooms = fut.result()
+            # only replace the current rooms once the whole file has loaded
             self.rooms.clear()
-            for rd in data.get("rooms", []):
-                r = Room.from_dict(rd)
-                self.rooms[r.name] = r
-            if not self.rooms:
-                raise ValueError("No rooms found in file")
-            self.current_room = sorted(self.rooms.keys())[0]
-            self._rebuild_rooms_menu()
-            self._refresh_room_list()
-            self._render_room()
-            self.status_var.set(f"Loaded layout from {path}")
+            self._sorted_room_names.clear()
+            # Icons are moved, found and removed by canvas tag, so tags must be unique within
+            # a room: advance icon_counter past the loaded tags, then retag duplicates
+            # (hand-edited or older files).
+            for r in rooms:
+                self._add_room(r)
+                for ic in r.icons:
+                    n = ic.tag[5:] if ic.tag.startswith("icon_") else ""
+                    if n.isdigit() and int(n) > self.icon_counter:
+                        self.icon_counter = int(n)
+            for r in rooms:
+                seen = set()
+                for ic in r.icons:
+                    if ic.tag in seen:
+                        self.icon_counter += 1
+                        ic.tag = f"icon_{self.icon_counter}"
+                    seen.add(ic.tag)
+            self.current_room = self._sorted_room_names[0]
+            self._request_room_views()
+            self._request_render()
+            # queued behind the render so its status refresh doesn't overwrite this
+            self.after_idle(self.status_var.set, f"Loaded layout from {path}")
         except Exception as e:
+            self._refresh_status()
             messagebox.showerror("Load Error", f"Failed to load: {e}")
 
     # ----------------------------- Tickers/FX -----------------------------
 
+    def _refresh_today(self):
+        day = datetime.date.today().day
+        if day != self._today_day:
+            self._today_day = day
+            for rm in self.rooms.values():
+                for ic in rm.icons:
+                    if ic.app_id == "calendar":
+                        ic.dirty = True
+            self._request_render()
+        self.after(60_000, self._refresh_today)
+
+    def _ensure_anim_running(self):
+        if self._anim_icons and not self._anim_scheduled:
+            self._anim_scheduled = True
+            self.after(DESKTOP_FRAME_MS, self._tick)
+
     def _tick(self):
-        # icon bob + simple sparkle anim
-        rm = self.rooms.get(self.current_room)
-        if rm:
-            changed = False
-            for ic in rm.icons:
-                if ic.animate:
-                    ic.vphase += 0.08
-                    dy = math.sin(ic.vphase) * 0.6
-                    ic.y += dy
-                    ic.y -= dy  # net zero per tick; we only want redraw shimmer; minor shift for effect
-                    changed = True
-            if changed:
-                self._render_room()
-        self.after(FRAME_MS, self._tick)
+        # idle rooms stop the loop; _ensure_anim_running restarts it
+        if not self._anim_icons:
+            self._anim_scheduled = False
+            return
+        # icon bob: shift existing items by the change in offset, never re-render
+        self._anim_t += 0.16  # same bob speed as 0.08 per tick at 60 FPS
+        t = self._anim_t
+        _sin, _move = math.sin, self.canvas.move
+        for ic in self._anim_icons:
+            if ic.vphase is None:
+                ic.vphase = random.random() * math.tau
+            dy = round(_sin(t + ic.vphase) * 4)
+            delta = dy - ic._last_bob_dy
+            if delta:
+                _move(ic.tag, 0, delta)
+                ic._last_bob_dy = dy
+        self.after(DESKTOP_FRAME_MS, self._tick)
 
     def _sparkle(self, ic: Icon):
         # brief sparkle effect over the icon
         if not ic.items:
             return
-        bbox = (ic.x-8, ic.y-8, ic.x+ic.w+8, ic.y+ic.h+8)
+        x1, y1, x2, y2 = ic.x-8, ic.y-8, ic.x+ic.w+8, ic.y+ic.h+8
+        _randint = random.randint
+        _coords, _config, _after = self.canvas.coords, self.canvas.itemconfigure, self.canvas.after
+        pool = self._spark_pool
+        n = self._spark_next
+        self.canvas.tag_raise("spark")
         for _ in range(12):
-            x = random.randint(bbox[0], bbox[2])
-            y = random.randint(bbox[1], bbox[3])
-            s = self.canvas.create_oval(x-2, y-2, x+2, y+2, fill="#ffffff", outline="")
-            self.canvas.after(random.randint(60, 240), lambda sid=s: self.canvas.delete(sid))
+            x = _randint(x1, x2)
+            y = _randint(y1, y2)
+            sid = pool[n % len(pool)]
+            n += 1
+            _coords(sid, x-2, y-2, x+2, y+2)
+            _config(sid, state="normal")
+            _after(_randint(60, 240), lambda s=sid: _config(s, state="hidden"))
+        self._spark_next = n
 
     # ----------------------------- Apps -----------------------------
 
@@ -818,21 +1157,30 @@ class TextPad(tk.Toplevel):
     def _open(self):
         path = filedialog.askopenfilename(title="Open", filetypes=[("Text Files","*.txt"),("All Files","*.*")])
         if not path: return
+        self.title(f"TextPad — Loading {os.path.basename(path)}…")
+        _when_done(self, _IO_POOL.submit(_read_text, path), self._opened)
+
+    def _opened(self, fut):
+        self.title("TextPad")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = f.read()
-            self.text.delete("1.0", "end")
-            self.text.insert("1.0", data)
+            data = fut.result()
         except Exception as e:
             messagebox.showerror("Open Error", str(e))
+            return
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", data)
 
     def _save_as(self):
         path = filedialog.asksaveasfilename(title="Save As", defaultextension=".txt",
                                             filetypes=[("Text Files","*.txt"),("All Files","*.*")])
         if not path: return
+        self.title(f"TextPad — Saving {os.path.basename(path)}…")
+        _when_done(self, _IO_POOL.submit(_write_text, path, self.text.get("1.0", "end-1c")), self._saved)
+
+    def _saved(self, fut):
+        self.title("TextPad")
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(self.text.get("1.0", "end-1c"))
+            fut.result()
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
 
@@ -852,8 +1200,7 @@ class CalendarWin(tk.Toplevel):
 
     def _refresh(self):
         today = datetime.date.today()
-        cal = calendar.TextCalendar(calendar.SUNDAY)
-        s = cal.formatmonth(theyear=today.year, themonth=today.month)
+        s = _month_text(today.year, today.month)
         self.lbl.config(text=f"{today.strftime('%B %Y')}")
         self.txt.configure(state="normal")
         self.txt.delete("1.0", "end")
@@ -863,6 +1210,9 @@ class CalendarWin(tk.Toplevel):
 # ----------------------------- HALT-DOS Terminal -----------------------------
 
 class HaltDOS(tk.Toplevel):
+    MAX_LINES = 5000   # scrollback cap; the oldest TRIM_LINES are dropped in one range delete
+    TRIM_LINES = 1000
+
     def __init__(self, app: HaltmannDesktop):
         super().__init__(app)
         self.app = app
@@ -873,11 +1223,29 @@ class HaltDOS(tk.Toplevel):
         self.entry = ttk.Entry(self)
         self.entry.pack(fill="x")
         self.entry.bind("<Return>", lambda e: self._run_cmd())
+        self._out_buf = []
+        self._flush_scheduled = False
         self._println("HALT‑DOS v0.64 — type 'help' for commands")
         self.entry.focus_set()
 
     def _println(self, s=""):
-        self.text.insert("end", s + "\n")
+        # buffered; _flush_out inserts everything printed this idle tick at once
+        self._out_buf.append(s + "\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            # registered on the root: a callback owned by this window is deleted with it,
+            # and 'exit' destroys the window with "> exit" still pending
+            self.app.after_idle(self._flush_out)
+
+    def _flush_out(self):
+        self._flush_scheduled = False
+        if not self._out_buf or not self.winfo_exists():
+            return
+        self.text.insert("end", "".join(self._out_buf))
+        self._out_buf.clear()
+        lines = int(self.text.index("end-1c").split(".")[0])
+        if lines > self.MAX_LINES:
+            self.text.delete("1.0", f"{self.TRIM_LINES + 1}.0")
         self.text.see("end")
 
     def _run_cmd(self):
@@ -890,38 +1258,79 @@ class HaltDOS(tk.Toplevel):
         name = parts[0].lower()
         args = parts[1:]
 
+        handler = self._CMDS.get(name)
         try:
-            if name in ("help", "?"):
-                self._println("Commands: help, time, apps, rooms, open <app>, room <name>, echo <msg>, clear, about, exit")
-            elif name == "time":
-                self._println(now_str())
-            elif name == "apps":
-                self._println("Apps: mario, terminal, textpad, web, calendar, settings, assistant")
-            elif name == "rooms":
-                self._println("Rooms: " + ", ".join(sorted(self.app.rooms.keys())))
-            elif name == "open" and args:
-                self._open_app(args[0])
-            elif name == "room" and args:
-                rn = " ".join(args)
-                if rn in self.app.rooms:
-                    self.app._switch_room(rn)
-                    self._println(f"Switched to room '{rn}'")
-                else:
-                    self._println(f"No such room: {rn}")
-            elif name == "echo":
-                self._println(" ".join(args))
-            elif name == "clear":
-                self.text.delete("1.0", "end")
-            elif name == "about":
-                self._println("HALTMANN WORKS CO / Flames Co Presents — MariOS 64 Tribute")
-                self._println("Fan-made room desktop with Mario-style demo. No external assets.")
-            elif name == "exit":
-                self.destroy()
-            else:
+            if handler is None or not handler(self, args):
                 self._println("Unknown command. Try 'help'.")
         except Exception as e:
             self._println(f"Error: {e}")
 
+    # Command handlers: called with the argument list; a falsy return means
+    # the arguments didn't fit and the command is reported as unknown.
+    def _cmd_help(self, args):
+        self._println("Commands: help, time, apps, rooms, open <app>, room <name>, echo <msg>, clear, about, exit")
+        return True
+
+    def _cmd_time(self, args):
+        self._println(now_str())
+        return True
+
+    def _cmd_apps(self, args):
+        self._println("Apps: mario, terminal, textpad, web, calendar, settings, assistant")
+        return True
+
+    def _cmd_rooms(self, args):
+        self._println("Rooms: " + ", ".join(self.app._sorted_room_names))
+        return True
+
+    def _cmd_open(self, args):
+        if not args:
+            return False
+        self._open_app(args[0])
+        return True
+
+    def _cmd_room(self, args):
+        if not args:
+            return False
+        rn = " ".join(args)
+        if rn in self.app.rooms:
+            self.app._switch_room(rn)
+            self._println(f"Switched to room '{rn}'")
+        else:
+            self._println(f"No such room: {rn}")
+        return True
+
+    def _cmd_echo(self, args):
+        self._println(" ".join(args))
+        return True
+
+    def _cmd_clear(self, args):
+        self._out_buf.clear()
+        self.text.delete("1.0", "end")
+        return True
+
+    def _cmd_about(self, args):
+        self._println("HALTMANN WORKS CO / Flames Co Presents — MariOS 64 Tribute")
+        self._println("Fan-made room desktop with Mario-style demo. No external assets.")
+        return True
+
+    def _cmd_exit(self, args):
+        self.destroy()
+        return True
+
+    _CMDS = {
+        "help": _cmd_help, "?": _cmd_help,
+        "time": _cmd_time,
+        "apps": _cmd_apps,
+        "rooms": _cmd_rooms,
+        "open": _cmd_open,
+        "room": _cmd_room,
+        "echo": _cmd_echo,
+        "clear": _cmd_clear,
+        "about": _cmd_about,
+        "exit": _cmd_exit,
+    }
+
     def _open_app(self, key):
         key = key.lower()
         mapping = {
@@ -960,7 +1369,7 @@ class WebSearch(tk.Toplevel):
         if not q:
             return
         try:
-            url = f"https://www.google.com/search?q={q.replace(' ', '+')}"
+            url = f"https://www.google.com/search?q={quote_plus(q)}"
             webbrowser.open(url)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open browser: {e}")
@@ -996,7 +1405,7 @@ class SettingsWin(tk.Toplevel):
     def _apply(self):
         rn = self.app.current_room
         self.app.rooms[rn].theme = self.theme.get()
-        self.app._render_room()
+        self.app._request_render()
 
 # ----------------------------- Assistant Maker -----------------------------
 
@@ -1046,6 +1455,8 @@ class MarioDemo(tk.Toplevel):
         self.canvas.pack()
 
         # Game state
+        self._ground_img = None
+        self._draw_static()
         self.reset_level()
 
         # Input
@@ -1054,25 +1465,32 @@ class MarioDemo(tk.Toplevel):
         self.focus_set()
 
         # Loop
-        self._last = time.time()
+        self._last = time.perf_counter() + FRAME_MS / 1000  # when the next tick is due
         self._running = True
+        self._render_pending = False
         self.after(FRAME_MS, self._tick)
 
     def reset_level(self):
         random.seed(RNG_SEED)
         self.keys = {"left": False, "right": False, "jump": False}
-        self.canvas.delete("all")
+        self.canvas.delete("world", "player", "hud")  # the static backdrop survives resets
         self.scroll_x = 0.0
         self.player = {"x": 80.0, "y": 320.0, "w": 24, "h": 32, "vx": 0.0, "vy": 0.0, "on_ground": False}
-        self.platforms = []  # list of rects (x,y,w,h)
-        self.coins = []      # list of (x,y,r, alive)
+        self.platforms = []  # list of rects (x,y,w,h); packed into columns below
+        coins = []           # list of (x,y,r); packed into columns below
         self.enemies = []    # list of dicts
         self.goal = {"x": 1400, "y": 280, "w": 12, "h": 120}
+        # goal geometry is static: bake the pole rect and flag triangle once (world coords)
+        gx, gy, gw, gh = self.goal["x"], self.goal["y"], self.goal["w"], self.goal["h"]
+        self._goal_rect = (gx, gy-gh, gx+gw, gy)
+        self._goal_flag_pts = (gx+gw, gy-gh+10, gx+gw+32, gy-gh+26, gx+gw, gy-gh+42)
 
         # Generate level (simple blocks)
         ground_y = 360
         for i in range(0, 1600, 80):
             self.platforms.append((i, ground_y, 80, 120))  # ground blocks
+        self._ground = set(self.platforms)  # drawn as one tiled image, not per-block items
+        self._ground_y = ground_y
 
         # Some floating platforms
         self.platforms += [
@@ -1083,67 +1501,171 @@ class MarioDemo(tk.Toplevel):
 
         # Coins
         for x in [260, 360, 460, 620, 720, 840, 1000, 1100, 1200]:
-            self.coins.append([x, 180, 8, True])
+            coins.append((x, 180, 8))
+
+        # Struct-of-arrays columns, sorted by x so _plat_range/_coin_range can bisect them
+        self.platforms.sort()
+        coins.sort()
+        self._plat_x = array("d", (x for x, y, w, h in self.platforms))
+        self._plat_y = array("d", (y for x, y, w, h in self.platforms))
+        self._plat_x2 = array("d", (x + w for x, y, w, h in self.platforms))
+        self._plat_y2 = array("d", (y + h for x, y, w, h in self.platforms))
+        self._plat_max_w = max(w for x, y, w, h in self.platforms)
+        self._coin_x = array("d", (x for x, y, r in coins))
+        self._coin_y = array("d", (y for x, y, r in coins))
+        self._coin_r = array("d", (r for x, y, r in coins))
+        self._coin_alive = bytearray(b"\x01") * len(coins)
+        self._coin_max_r = max(self._coin_r, default=0)
 
         # One enemy (goomba-like)
         self.enemies.append({"x": 520.0, "y": ground_y-20, "w": 28, "h": 20, "vx": -1.0, "alive": True})
 
         self.score = 0
         self.win = False
-        self._draw_static()
+        self._create_world_items()
 
     def _draw_static(self):
-        self.canvas.delete("bg")
-        # Sky gradient
+        # Sky gradient + hills rasterized once into a PhotoImage and blitted as a single item;
+        # the image is kept on self so Tk doesn't lose it
+        img = self._bg_img = tk.PhotoImage(width=self.W, height=self.H)
         for i in range(8):
             c = 135 - i*8
-            self.canvas.create_rectangle(0, i*(self.H/8), self.W, (i+1)*(self.H/8),
-                                         fill=f"#{c:02x}{(206-i*8):02x}{(235-i*12):02x}", outline="", tags="bg")
+            _put_rect(img, 0, i*(self.H/8), self.W, (i+1)*(self.H/8), f"#{c:02x}{(206-i*8):02x}{(235-i*12):02x}")
         # Hills
-        self.canvas.create_oval(-80, 300, 200, 520, fill="#77dd77", outline="", tags="bg")
-        self.canvas.create_oval(220, 280, 560, 560, fill="#77dd77", outline="", tags="bg")
-        self.canvas.create_oval(520, 320, 900, 620, fill="#77dd77", outline="", tags="bg")
+        _put_ellipse(img, -80, 300, 200, 520, "#77dd77")
+        _put_ellipse(img, 220, 280, 560, 560, "#77dd77")
+        _put_ellipse(img, 520, 320, 900, 620, "#77dd77")
+        self.canvas.create_image(0, 0, anchor="nw", image=img, tags="bg")
+
+    def _create_world_items(self):
+        # One persistent canvas item per world object, created once per level.
+        # _draw_world/_draw_player only update coords and visibility.
+        c = self.canvas
+        self._ground_id = c.create_image(0, self._ground_y, anchor="nw", image=self._ground_image(), tags="world")
+        # ground blocks have no item of their own (None); only floating platforms do.
+        # Platforms and coins start hidden; _draw_world shows the ones in view.
+        self._platform_ids = [None if pl in self._ground else
+                              c.create_rectangle(0, 0, 0, 0, fill="#8b4513", outline="#5d3310",
+                                                 state="hidden", tags="world")
+                              for pl in self.platforms]
+        self._coin_ids = [c.create_oval(0, 0, 0, 0, fill="#ffd700", outline="#c59d00", state="hidden", tags="world")
+                          for _ in self._coin_x]
+        self._enemy_ids = [(c.create_oval(0, 0, 0, 0, fill="#8e5a2b", outline="#5d3310", tags="world"),
+                            c.create_oval(0, 0, 0, 0, fill="#8e5a2b", outline="#5d3310", tags="world"))
+                           for _ in self.enemies]
+        self._goal_pole_id = c.create_rectangle(0, 0, 0, 0, fill="#2c3e50", outline="", tags="world")
+        self._goal_flag_id = c.create_polygon(0, 0, 0, 0, 0, 0, fill="#e74c3c", outline="#c0392b", tags="world")
+        self._player_ids = (
+            c.create_rectangle(0, 0, 0, 0, fill="#ff4136", outline="#85144b", tags="player"),  # body
+            c.create_oval(0, 0, 0, 0, fill="#fce5cd", outline="#b5651d", tags="player"),       # head
+            c.create_rectangle(0, 0, 0, 0, fill="#ff4136", outline="", tags="player"),         # cap
+        )
+        self._score_id = c.create_text(8, 8, anchor="nw", text="", font=("Consolas", 12, "bold"), tags="hud")
+        self._win_id = c.create_text(self.W//2, 40, text="YOU WIN! Press R to restart, Esc to exit.",
+                                     font=("Segoe UI", 14, "bold"), fill="#2c3e50", state="hidden", tags="hud")
+        # item ids currently hidden, so state is only sent to Tk on change
+        self._hidden = {self._win_id, *self._coin_ids}
+        self._hidden.update(pid for pid in self._platform_ids if pid is not None)
+        self._drawn_sx = None   # scroll offset static items were last positioned for
+        self._plat_vis = range(0)  # platform/coin index windows shown at _drawn_sx
+        self._coin_vis = range(0)
+        self._drawn_score = None
+
+    def _plat_range(self, lo, hi):
+        """Indices of platforms whose x-extent may touch [lo, hi] (callers still test exactly)."""
+        return range(bisect.bisect_left(self._plat_x, lo - self._plat_max_w),
+                     bisect.bisect_right(self._plat_x, hi))
+
+    def _coin_range(self, lo, hi):
+        """Indices of coins whose x-extent may touch [lo, hi]."""
+        return range(bisect.bisect_left(self._coin_x, lo - self._coin_max_r),
+                     bisect.bisect_right(self._coin_x, hi + self._coin_max_r))
+
+    def _ground_image(self):
+        # ground strip rasterized once, block outlines included; the level layout is fixed
+        if self._ground_img is None:
+            img = self._ground_img = tk.PhotoImage(width=1600, height=120)
+            for x, y, w, h in sorted(self._ground):
+                y -= self._ground_y
+                _put_rect(img, x, y, x+w, y+h, "#5d3310")
+                _put_rect(img, x+1, y+1, x+w-1, y+h-1, "#8b4513")
+        return self._ground_img
+
+    def _set_visible(self, iid, visible):
+        if visible:
+            if iid in self._hidden:
+                self._hidden.discard(iid)
+                self.canvas.itemconfigure(iid, state="normal")
+        elif iid not in self._hidden:
+            self._hidden.add(iid)
+            self.canvas.itemconfigure(iid, state="hidden")
 
     def _draw_world(self):
-        self.canvas.delete("world")
+        c = self.canvas
         sx = self.scroll_x
-        # Platforms
-        for (x,y,w,h) in self.platforms:
-            self.canvas.create_rectangle(x - sx, y, x + w - sx, y + h, fill="#8b4513", outline="#5d3310", tags="world")
+        W = self.W
+        moved = sx != self._drawn_sx
+        self._drawn_sx = sx
+        # Platforms and goal only move when the view scrolls; only the visible window is
+        # touched, and items that left it are hidden
+        if moved:
+            c.coords(self._ground_id, -sx, self._ground_y)
+            vis = self._plat_range(sx, sx + W)
+            for i in self._plat_vis:
+                if i not in vis and self._platform_ids[i] is not None:
+                    self._set_visible(self._platform_ids[i], False)
+            px, px2 = self._plat_x, self._plat_x2
+            for i in vis:
+                pid = self._platform_ids[i]
+                if pid is None:
+                    continue
+                on = px2[i] - sx >= 0 and px[i] - sx <= W
+                self._set_visible(pid, on)
+                if on:
+                    c.coords(pid, px[i] - sx, self._plat_y[i], px2[i] - sx, self._plat_y2[i])
+            self._plat_vis = vis
+            x1, y1, x2, y2 = self._goal_rect
+            c.coords(self._goal_pole_id, x1 - sx, y1, x2 - sx, y2)
+            f = self._goal_flag_pts
+            c.coords(self._goal_flag_id, f[0] - sx, f[1], f[2] - sx, f[3], f[4] - sx, f[5])
         # Coins
-        for cx, cy, r, alive in self.coins:
-            if not alive: continue
-            self.canvas.create_oval(cx-r - sx, cy-r, cx+r - sx, cy+r, fill="#ffd700", outline="#c59d00", tags="world")
+        vis = self._coin_range(sx, sx + W) if moved else self._coin_vis
+        if moved:
+            for i in self._coin_vis:
+                if i not in vis:
+                    self._set_visible(self._coin_ids[i], False)
+            self._coin_vis = vis
+        for i in vis:
+            cid = self._coin_ids[i]
+            cx, cy, r = self._coin_x[i], self._coin_y[i], self._coin_r[i]
+            on = self._coin_alive[i] and cx + r - sx >= 0 and cx - r - sx <= W
+            self._set_visible(cid, on)
+            if on and moved:
+                c.coords(cid, cx-r - sx, cy-r, cx+r - sx, cy+r)
         # Enemy
-        for e in self.enemies:
-            if not e["alive"]: continue
+        for (body, head), e in zip(self._enemy_ids, self.enemies):
             x,y,w,h = e["x"]-sx, e["y"], e["w"], e["h"]
-            self.canvas.create_oval(x, y, x+w, y+h, fill="#8e5a2b", outline="#5d3310", tags="world")
-            self.canvas.create_oval(x+6, y-10, x+w-6, y, fill="#8e5a2b", outline="#5d3310", tags="world")
-
-        # Goal flag
-        g = self.goal
-        self.canvas.create_rectangle(g["x"] - sx, g["y"]-g["h"], g["x"]+g["w"] - sx, g["y"], fill="#2c3e50", outline="", tags="world")
-        self.canvas.create_polygon(g["x"]+g["w"] - sx, g["y"]-g["h"]+10, g["x"]+g["w"]+32 - sx, g["y"]-g["h"]+26,
-                                   g["x"]+g["w"] - sx, g["y"]-g["h"]+42, fill="#e74c3c", outline="#c0392b", tags="world")
+            on = e["alive"] and x + w >= 0 and x <= W
+            self._set_visible(body, on)
+            self._set_visible(head, on)
+            if on:
+                c.coords(body, x, y, x+w, y+h)
+                c.coords(head, x+6, y-10, x+w-6, y)
 
         # HUD
-        self.canvas.delete("hud")
-        self.canvas.create_text(8, 8, anchor="nw", text=f"Score: {self.score}", font=("Consolas", 12, "bold"), tags="hud")
-        if self.win:
-            self.canvas.create_text(self.W//2, 40, text="YOU WIN! Press R to restart, Esc to exit.",
-                                    font=("Segoe UI", 14, "bold"), fill="#2c3e50", tags="hud")
+        if self.score != self._drawn_score:
+            self._drawn_score = self.score
+            c.itemconfigure(self._score_id, text=f"Score: {self.score}")
+        self._set_visible(self._win_id, self.win)
 
     def _draw_player(self):
-        self.canvas.delete("player")
         p = self.player
         x, y, w, h = p["x"]-self.scroll_x, p["y"], p["w"], p["h"]
-        # Body
-        self.canvas.create_rectangle(x, y, x+w, y+h, fill="#ff4136", outline="#85144b", tags="player")
-        # Head
-        self.canvas.create_oval(x-2, y-18, x+w+2, y+2, fill="#fce5cd", outline="#b5651d", tags="player")
-        # Cap
-        self.canvas.create_rectangle(x-4, y-18, x+w+4, y-12, fill="#ff4136", outline="", tags="player")
+        body, head, cap = self._player_ids
+        c = self.canvas
+        c.coords(body, x, y, x+w, y+h)
+        c.coords(head, x-2, y-18, x+w+2, y+2)
+        c.coords(cap, x-4, y-18, x+w+4, y-12)
 
     def _on_key(self, e):
         k = e.keysym.lower()
@@ -1166,26 +1688,44 @@ class MarioDemo(tk.Toplevel):
     def _tick(self):
         if not self._running:
             return
+        # Frames run on a fixed grid measured tick start to tick start, so the time Tk
+        # spends repainting at idle between ticks counts against the frame, not just the
+        # Python-side work below. A tick more than a frame late resyncs instead of bursting.
+        frame = FRAME_MS / 1000
+        now = time.perf_counter()
+        if now - self._last > frame:
+            self._last = now
+        self._last += frame
         # physics step (fixed-ish)
         self._update_physics()
-        # draw
-        self._draw_world()
-        self._draw_player()
-        self.after(FRAME_MS, self._tick)
+        # draw, unless Tk hasn't gone idle (and repainted) since the last frame's draw
+        if not self._render_pending:
+            self._render_pending = True
+            self._draw_world()
+            self._draw_player()
+            self.after_idle(self._render_done)
+        # schedule the next tick for what is left of the frame, so slow frames don't
+        # pile up in Tk's queue
+        delay_ms = int((self._last - time.perf_counter()) * 1000)
+        self.after(max(1, delay_ms), self._tick)
+
+    def _render_done(self):
+        self._render_pending = False
 
     def _update_physics(self):
         p = self.player
+        _clamp = clamp
         # Movement input
         ax = 0.0
         if self.keys["left"]: ax -= 0.8
         if self.keys["right"]: ax += 0.8
         p["vx"] += ax
         p["vx"] *= 0.9  # friction
-        p["vx"] = clamp(p["vx"], -4.0, 4.0)
+        p["vx"] = _clamp(p["vx"], -4.0, 4.0)
 
         # Gravity
         p["vy"] += 0.8
-        p["vy"] = clamp(p["vy"], -12.0, 12.0)
+        p["vy"] = _clamp(p["vy"], -12.0, 12.0)
 
         # Integrate X, Y with simple AABB collisions
         self._move_and_collide(p, p["vx"], 0)
@@ -1202,14 +1742,16 @@ class MarioDemo(tk.Toplevel):
             self.scroll_x = p["x"] - self.W*0.6
         if center < self.W*0.3:
             self.scroll_x = p["x"] - self.W*0.3
-        self.scroll_x = clamp(self.scroll_x, 0, 1600 - self.W)
+        self.scroll_x = _clamp(self.scroll_x, 0, 1600 - self.W)
 
         # Coins
-        pr = (p["x"], p["y"], p["x"]+p["w"], p["y"]+p["h"])
-        for c in self.coins:
-            if not c[3]: continue
-            if _rect_circle_overlap(pr, (c[0], c[1], c[2])):
-                c[3] = False
+        x1, y1, x2, y2 = p["x"], p["y"], p["x"]+p["w"], p["y"]+p["h"]
+        alive = self._coin_alive
+        _rco = _rect_circle_overlap
+        for i in self._coin_range(x1, x2):
+            if not alive[i]: continue
+            if _rco(x1, y1, x2, y2, self._coin_x[i], self._coin_y[i], self._coin_r[i]):
+                alive[i] = 0
                 self.score += 100
 
         # Enemy AI
@@ -1221,8 +1763,7 @@ class MarioDemo(tk.Toplevel):
                 e["vx"] *= -1
 
             # Player stomp check
-            er = (e["x"], e["y"], e["x"]+e["w"], e["y"]+e["h"])
-            if _rects_overlap(pr, er):
+            if _rects_overlap(x1, y1, x2, y2, e["x"], e["y"], e["x"]+e["w"], e["y"]+e["h"]):
                 # If player is falling and above enemy -> stomp
                 if p["vy"] > 0 and p["y"] + p["h"] - 6 <= e["y"]:
                     e["alive"] = False
@@ -1234,85 +1775,99 @@ class MarioDemo(tk.Toplevel):
                     return
 
         # Goal check
-        gr = (self.goal["x"], self.goal["y"]-self.goal["h"], self.goal["x"]+self.goal["w"], self.goal["y"])
-        if _rects_overlap(pr, gr):
+        gx1, gy1, gx2, gy2 = self._goal_rect
+        if _rects_overlap(x1, y1, x2, y2, gx1, gy1, gx2, gy2):
             self.win = True
 
     def _move_and_collide(self, p, dx, dy):
-        # Move axis and resolve against platforms
-        p["x"] += dx
-        p["y"] += dy
-        p["on_ground"] = False
-        pr = [p["x"], p["y"], p["x"]+p["w"], p["y"]+p["h"]]
-
-        for (x,y,w,h) in self.platforms:
-            r = (x, y, x+w, y+h)
-            if not _rects_overlap(pr, r):
-                continue
-            # resolve
-            overlap_x = min(pr[2], r[2]) - max(pr[0], r[0])
-            overlap_y = min(pr[3], r[3]) - max(pr[1], r[1])
-            if abs(overlap_x) < abs(overlap_y):
-                # resolve along x
-                if dx > 0:
-                    p["x"] -= overlap_x
-                else:
-                    p["x"] += overlap_x
-                p["vx"] = 0.0
-            else:
-                # resolve along y
-                if dy > 0:
-                    p["y"] -= overlap_y
-                    p["vy"] = 0.0
-                    p["on_ground"] = True
-                else:
-                    p["y"] += overlap_y
-                    p["vy"] = 0.0
+        # Move axis and resolve against nearby platforms; the numeric loop works on plain
+        # floats in _resolve_aabb, so the player dict is only read and written once
+        x, y = p["x"] + dx, p["y"] + dy
+        near = self._plat_range(x, x + p["w"])
+        x, y, stop_x, stop_y, on_ground = _resolve_aabb(x, y, p["w"], p["h"], dx, dy, self._plat_x, self._plat_y,
+                                                        self._plat_x2, self._plat_y2, near)
+        p["x"], p["y"], p["on_ground"] = x, y, on_ground
+        if stop_x:
+            p["vx"] = 0.0
+        if stop_y:
+            p["vy"] = 0.0
 
     def _enemy_hits_edge(self, e):
         # Simple edge detection: if nothing under next step or colliding with wall
         next_x = e["x"] + e["vx"]
-        er = (next_x, e["y"], next_x + e["w"], e["y"] + e["h"])
+        ex1, ey1, ex2, ey2 = next_x, e["y"], next_x + e["w"], e["y"] + e["h"]
+
+        near = self._plat_range(next_x - 1, next_x + e["w"] + 1)
+        px, py, px2, py2 = self._plat_x, self._plat_y, self._plat_x2, self._plat_y2
+        _ro = _rects_overlap
 
         # If colliding with wall/platform side
-        for (x,y,w,h) in self.platforms:
-            r = (x, y, x+w, y+h)
-            if _rects_overlap(er, r):
+        for i in near:
+            if _ro(ex1, ey1, ex2, ey2, px[i], py[i], px2[i], py2[i]):
                 # allow standing on ground; if significant side overlap then "edge"
-                if e["y"] + e["h"] <= y + 2:  # on top
+                if e["y"] + e["h"] <= py[i] + 2:  # on top
                     continue
                 return True
 
         # if stepping into void (no ground underneath future pos)
         below = False
-        for (x,y,w,h) in self.platforms:
-            if next_x + e["w"]/2 >= x and next_x + e["w"]/2 <= x+w:
-                if e["y"] + e["h"] + 2 >= y and e["y"] + e["h"] <= y + 6:
+        for i in near:
+            if next_x + e["w"]/2 >= px[i] and next_x + e["w"]/2 <= px2[i]:
+                if e["y"] + e["h"] + 2 >= py[i] and e["y"] + e["h"] <= py[i] + 6:
                     below = True
                     break
         return not below
 
 # ----------------------------- Geometry helpers -----------------------------
 
-def _rects_overlap(a, b):
-    return not (a[2] <= b[0] or a[0] >= b[2] or a[3] <= b[1] or a[1] >= b[3])
+# Both helpers take plain scalars rather than tuples: they run per candidate platform/coin
+# per entity per frame, so avoiding tuple packing/unpacking and the clamp() call matters.
 
-def _rect_circle_overlap(rect, circle):
+def _rects_overlap(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
+    return not (ax2 <= bx1 or ax1 >= bx2 or ay2 <= by1 or ay1 >= by2)
+
+def _rect_circle_overlap(x1, y1, x2, y2, cx, cy, r):
     # rect: (x1,y1,x2,y2), circle: (cx, cy, r)
-    x1,y1,x2,y2 = rect
-    cx,cy,r = circle
-    nearest_x = clamp(cx, x1, x2)
-    nearest_y = clamp(cy, y1, y2)
-    dx = cx - nearest_x
-    dy = cy - nearest_y
+    dx = cx - max(x1, min(x2, cx))
+    dy = cy - max(y1, min(y2, cy))
     return (dx*dx + dy*dy) <= r*r
 
+def _resolve_aabb(px, py, pw, ph, dx, dy, xs, ys, x2s, y2s, idx):
+    """Push a box that just moved by (dx, dy) out of the platforms indexed by idx.
+    Platforms are given as x/y/x2/y2 columns. Overlaps are measured against the moved
+    box before any correction. Returns (px, py, stop_x, stop_y, on_ground).
+    """
+    x1, y1, x2, y2 = px, py, px + pw, py + ph
+    stop_x = stop_y = on_ground = False
+    for i in idx:
+        bx1, by1, bx2, by2 = xs[i], ys[i], x2s[i], y2s[i]
+        if x2 <= bx1 or x1 >= bx2 or y2 <= by1 or y1 >= by2:
+            continue
+        overlap_x = min(x2, bx2) - max(x1, bx1)
+        overlap_y = min(y2, by2) - max(y1, by1)
+        if abs(overlap_x) < abs(overlap_y):
+            # resolve along x
+            if dx > 0:
+                px -= overlap_x
+            else:
+                px += overlap_x
+            stop_x = True
+        else:
+            # resolve along y
+            if dy > 0:
+                py -= overlap_y
+                on_ground = True
+            else:
+                py += overlap_y
+            stop_y = True
+    return px, py, stop_x, stop_y, on_ground
+
 # ----------------------------- Entry -----------------------------
 
 def main():
     app = HaltmannDesktop()
     # render initial view after widgets laid out
-    app.after(10, app._render_room)
+    app.after(10, app._request_render)
     app.mainloop()
 
 if __name__ == "__main__":